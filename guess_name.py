@@ -3,14 +3,25 @@ from enum import Enum
 from pathlib import Path
 import random
 import json
-import re
+import hashlib
+from collections import Counter, deque
 
 import typer
-import openai
 import asyncio
+import httpx
+import aiohttp
+import diskcache
 from openai import AsyncOpenAI
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 import matplotlib.pyplot as plt
 
+from question_cache import QuestionCache
+
 
 class OpenAIModel(str, Enum):
     GPT_3_5_TURBO = "gpt-3.5-turbo"
@@ -23,14 +34,343 @@ class OpenAIModel(str, Enum):
     O4_MINI = "o4-mini"
 
 
+# models that spend completion tokens on hidden reasoning before the visible reply
+_REASONING_MODELS = {OpenAIModel.O3_MINI, OpenAIModel.O4_MINI}
+# models that support strict json_schema structured outputs, required by the oracle
+_STRUCTURED_OUTPUT_MODELS = {
+    OpenAIModel.GPT_4O,
+    OpenAIModel.GPT_4O_MINI,
+    OpenAIModel.O3_MINI,
+    OpenAIModel.O4_MINI,
+}
+
+
 class ReasoningEffort(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
 
 
+class OracleReplyError(RuntimeError):
+    """
+    The oracle answered, but not with a usable verdict (refusal, truncation, unparseable reply).
+    """
+
+
+class OracleRequestError(RuntimeError):
+    """
+    The API rejected an oracle request outright (non-retryable 4xx, e.g. bad key or model).
+    """
+
+
 app = typer.Typer()
 
+# shared connection pool so every oracle/question call reuses open TCP/TLS sessions
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=200,
+    max_keepalive_connections=100,
+    keepalive_expiry=60,
+)
+_ASYNC_CLIENTS: dict[str, AsyncOpenAI] = {}
+
+# the oracle fan-out bypasses the SDK and posts straight to the REST endpoint
+_CHAT_COMPLETIONS_URL = "https://api.openai.com/v1/chat/completions"
+_HTTP_SESSION: aiohttp.ClientSession | None = None
+
+# cap in-flight oracle requests to stay under the account's rate limits
+_ORACLE_SEM = asyncio.Semaphore(int(os.getenv("ORACLE_CONCURRENCY", "32")))
+
+# static oracle instructions, shared by every call
+_ORACLE_SYSTEM_PROMPT = (
+    "You are a reasoning oracle. Evaluate whether the target character fits the question. "
+    "If the question is a direct guess of the character and correct, the answer is \"successful_guess\". "
+    "If it is an incorrect guess, the answer is \"no\". "
+    "For yes/no questions, the answer is \"yes\" or \"no\"."
+)
+_ORACLE_BATCH_SYSTEM_PROMPT = (
+    "You are a reasoning oracle. Evaluate whether each candidate character fits the question. "
+    "If the question is a direct guess of a candidate and correct, that candidate's answer is \"successful_guess\". "
+    "If it is an incorrect guess, the answer is \"no\". "
+    "For yes/no questions, answer \"yes\" or \"no\" for each candidate."
+)
+
+# structured-output schemas constraining the oracle to a bare verdict
+_VERDICTS = ["yes", "no", "successful_guess"]
+_VERDICT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "verdict",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"answer": {"type": "string", "enum": _VERDICTS}},
+            "required": ["answer"],
+            "additionalProperties": False,
+        },
+    },
+}
+_BATCH_VERDICT_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "verdicts",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "answers": {"type": "array", "items": {"type": "string", "enum": _VERDICTS}},
+            },
+            "required": ["answers"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+# oracle verdicts keyed by (oracle model, question, candidate) so duplicates are never re-queried
+_ORACLE_CACHE: dict[tuple[str, str, str], str] = {}
+# persistent L2 behind _ORACLE_CACHE so reruns of comparable experiments reuse verdicts;
+# keys include a fingerprint of the oracle prompts and response formats, so changing how the
+# oracle is asked invalidates old verdicts. Bump _ORACLE_PROMPT_REVISION when editing the
+# per-call user turns, which are not covered by the fingerprint.
+_ORACLE_PROMPT_REVISION = 2
+_ORACLE_CACHE_VERSION = hashlib.sha256(json.dumps([
+    _ORACLE_PROMPT_REVISION,
+    _ORACLE_SYSTEM_PROMPT,
+    _ORACLE_BATCH_SYSTEM_PROMPT,
+    _VERDICT_FORMAT,
+    _BATCH_VERDICT_FORMAT,
+]).encode("utf-8")).hexdigest()[:16]
+_ORACLE_DISK_CACHE_DIR = Path.home() / ".guess_who_oracle"
+_ORACLE_DISK_CACHE: diskcache.Cache | None = None
+
+
+def _get_async_client(api_key: str) -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client for this API key, creating it on first use.
+    """
+    client = _ASYNC_CLIENTS.get(api_key)
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(limits=_HTTP_LIMITS),
+        )
+        _ASYNC_CLIENTS[api_key] = client
+    return client
+
+
+def _get_http_session() -> aiohttp.ClientSession:
+    """
+    Return the process-wide aiohttp session, creating it on first use.
+    Must be called from inside the running event loop.
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=200,
+                ttl_dns_cache=300,
+            )
+        )
+    return _HTTP_SESSION
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """
+    Retry on rate limiting, transient server errors and dropped connections.
+    """
+    if isinstance(exc, aiohttp.ClientResponseError):
+        return exc.status == 429 or exc.status >= 500
+    return isinstance(exc, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+async def _post_chat_completion(payload: dict, api_key: str) -> str:
+    """
+    POST a chat completion request and return the reply text.
+    Concurrency is bounded by _ORACLE_SEM; 429s and connection errors are retried with backoff.
+    """
+    session = _get_http_session()
+    async for attempt in AsyncRetrying(
+        retry=retry_if_exception(_is_retryable),
+        wait=wait_random_exponential(multiplier=1, max=60),
+        stop=stop_after_attempt(6),
+        reraise=True,
+    ):
+        with attempt:
+            async with _ORACLE_SEM:
+                async with session.post(
+                    _CHAT_COMPLETIONS_URL,
+                    json=payload,
+                    headers={"Authorization": f"Bearer {api_key}"},
+                ) as response:
+                    if response.status >= 400 and response.status != 429 and response.status < 500:
+                        # not retryable: keep the API's explanation instead of a bare status
+                        raise OracleRequestError(
+                            f"{payload['model']} request failed ({response.status}): {await response.text()}"
+                        )
+                    response.raise_for_status()
+                    data = await response.json()
+    choice = data["choices"][0]
+    message = choice["message"]
+    if message.get("refusal"):
+        raise OracleReplyError(f"{payload['model']} refused to answer: {message['refusal']}")
+    if choice.get("finish_reason") == "length":
+        raise OracleReplyError(
+            f"{payload['model']} reply truncated at max_completion_tokens={payload.get('max_completion_tokens')}"
+        )
+    if message.get("content") is None:
+        raise OracleReplyError(f"{payload['model']} returned an empty reply")
+    return message["content"]
+
+
+async def _gather_or_cancel(*aws):
+    """
+    Like asyncio.gather, but if one awaitable fails the others are cancelled and awaited
+    before the error is re-raised, so nothing is left running against closed clients.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _close_http_clients() -> None:
+    global _HTTP_SESSION
+    for client in _ASYNC_CLIENTS.values():
+        await client.close()
+    _ASYNC_CLIENTS.clear()
+    if _HTTP_SESSION is not None:
+        await _HTTP_SESSION.close()
+        _HTTP_SESSION = None
+
+
+def _open_oracle_disk_cache() -> None:
+    global _ORACLE_DISK_CACHE
+    if _ORACLE_DISK_CACHE is None:
+        _ORACLE_DISK_CACHE = diskcache.Cache(str(_ORACLE_DISK_CACHE_DIR))
+
+
+def _close_oracle_disk_cache() -> None:
+    global _ORACLE_DISK_CACHE
+    if _ORACLE_DISK_CACHE is not None:
+        _ORACLE_DISK_CACHE.close()
+        _ORACLE_DISK_CACHE = None
+
+
+def _oracle_disk_key(model: str, question: str, candidate: str) -> str:
+    key = f"{_ORACLE_CACHE_VERSION}|{model}|{question}|{candidate}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def _cached_verdict(model: str, question: str, candidate: str) -> str | None:
+    """
+    Look up a verdict in the in-memory cache, then on disk (promoting disk hits to memory).
+    """
+    key = (model, question, candidate)
+    verdict = _ORACLE_CACHE.get(key)
+    if verdict is None and _ORACLE_DISK_CACHE is not None:
+        verdict = _ORACLE_DISK_CACHE.get(_oracle_disk_key(*key))
+        if verdict is not None:
+            _ORACLE_CACHE[key] = verdict
+    return verdict
+
+
+def _store_verdict(model: str, question: str, candidate: str, verdict: str) -> None:
+    _ORACLE_CACHE[(model, question, candidate)] = verdict
+    if _ORACLE_DISK_CACHE is not None:
+        _ORACLE_DISK_CACHE.set(_oracle_disk_key(model, question, candidate), verdict)
+
+
+def _oracle_token_budget(model: OpenAIModel, n_verdicts: int) -> int:
+    """
+    Completion-token cap for an oracle reply holding n_verdicts schema-constrained verdicts.
+    Reasoning models bill hidden reasoning against the same cap, so they keep a large budget.
+    """
+    if model in _REASONING_MODELS:
+        return 20000
+    return 16 + 8 * n_verdicts
+
+
+async def oracle_async(question: str, target: str, model: OpenAIModel, api_key: str) -> str:
+    """
+    Async oracle helper: evaluate question against a target character.
+    Verdicts are memoized in memory and, unless disabled, on disk.
+    """
+    cached = _cached_verdict(model.value, question, target)
+    if cached is not None:
+        return cached
+    user_prompt = (
+        f"Question to evaluate: {question}\n"
+        f"Target character: {target}"
+    )
+    messages = [
+        {"role": "system", "content": _ORACLE_SYSTEM_PROMPT},
+        {"role": "user", "content": user_prompt},
+    ]
+    payload = {
+        "model": model.value,
+        "messages": messages,
+        "response_format": _VERDICT_FORMAT,
+        "max_completion_tokens": _oracle_token_budget(model, 1),
+    }
+    reply = await _post_chat_completion(payload, api_key)
+    try:
+        verdict = json.loads(reply)["answer"]
+    except (json.JSONDecodeError, KeyError, TypeError) as exc:
+        raise OracleReplyError(f"{model.value} returned an unparseable verdict: {reply!r}") from exc
+    _store_verdict(model.value, question, target, verdict)
+    return verdict
+
+
+async def oracle_batch_async(question: str, candidates: list[str], model: OpenAIModel, api_key: str) -> list[str]:
+    """
+    Async oracle helper: evaluate question against all candidates in a single request.
+    Falls back to one oracle_async call per candidate if the reply cannot be parsed.
+    """
+    pending = list(dict.fromkeys(
+        cand for cand in candidates if _cached_verdict(model.value, question, cand) is None
+    ))
+    if pending:
+        numbered = "\n".join(f"{i}. {cand}" for i, cand in enumerate(pending, start=1))
+        user_prompt = (
+            f"Question to evaluate: {question}\n"
+            f"Candidates:\n{numbered}\n"
+            f"Return exactly {len(pending)} answers, in the same order as the candidates."
+        )
+        payload = {
+            "model": model.value,
+            "messages": [
+                {"role": "system", "content": _ORACLE_BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt},
+            ],
+            "response_format": _BATCH_VERDICT_FORMAT,
+            "max_completion_tokens": _oracle_token_budget(model, len(pending)),
+        }
+        # request failures (OracleRequestError) propagate: per-candidate calls would fail the same way
+        problem = None
+        try:
+            reply = await _post_chat_completion(payload, api_key)
+            answers = list(json.loads(reply)["answers"])
+        except OracleReplyError as exc:
+            problem = str(exc)
+        except (json.JSONDecodeError, KeyError, TypeError):
+            problem = f"{model.value} returned an unparseable reply"
+        else:
+            if len(answers) != len(pending):
+                problem = f"{model.value} returned {len(answers)} answers for {len(pending)} candidates"
+        if problem is None:
+            for cand, verdict in zip(pending, answers):
+                _store_verdict(model.value, question, cand, verdict)
+        else:
+            typer.secho(f"Batched oracle reply unusable ({problem}); querying candidates individually.", fg=typer.colors.RED)
+            await _gather_or_cancel(*(
+                oracle_async(question, cand, model, api_key) for cand in pending
+            ))
+    return [_ORACLE_CACHE[(model.value, question, cand)] for cand in candidates]
+
 
 @app.command()
 def main(
@@ -69,6 +409,23 @@ def main(
         "-o",
         help="OpenAI model to use for oracle responses.",
     ),
+    survivor_oracle_model: OpenAIModel = typer.Option(
+        OpenAIModel.GPT_4O_MINI,
+        "--survivor-oracle-model",
+        help="Cheaper OpenAI model used to score surviving candidates; the oracle model only answers for the target.",
+    ),
+    strict: bool = typer.Option(
+        False,
+        "--strict",
+        help="Score survivors with the oracle model too (ignores --survivor-oracle-model).",
+    ),
+    context_window: int = typer.Option(
+        0,
+        "--context-window",
+        "-k",
+        min=0,
+        help="Only resend the last K question/answer turns plus a list of remaining candidates (0 = full history).",
+    ),
     reasoning_effort: ReasoningEffort = typer.Option(
         ReasoningEffort.MEDIUM,
         "--reasoning-effort",
@@ -76,6 +433,16 @@ def main(
         case_sensitive=False,
         help="Reasoning effort level: low, medium, or high.",
     ),
+    use_cache: bool = typer.Option(
+        False,
+        "--use-cache",
+        help="Reuse previously generated questions from the on-disk semantic question cache.",
+    ),
+    no_oracle_cache: bool = typer.Option(
+        False,
+        "--no-oracle-cache",
+        help="Bypass the persistent oracle verdict cache (~/.guess_who_oracle).",
+    ),
 ) -> None:
     """
     Guess names based on an input list and OpenAI model.
@@ -87,145 +454,199 @@ def main(
             fg=typer.colors.RED,
         )
         raise typer.Exit(1)
-    openai.api_key = api_key
 
-    # initialize async loop and client for faster oracle calls
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    async_client = AsyncOpenAI(api_key=api_key)
+    question_cache = None
+    if use_cache:
+        try:
+            question_cache = QuestionCache()
+        except ImportError as exc:
+            typer.secho(f"Error: {exc}", fg=typer.colors.RED)
+            raise typer.Exit(1)
 
-    # Read names from file
-    content = input_file.read_text(encoding="utf-8")
-    names = [line.strip() for line in content.splitlines() if line.strip()]
+    supported = ", ".join(m.value for m in OpenAIModel if m in _STRUCTURED_OUTPUT_MODELS)
+    if oracle_model not in _STRUCTURED_OUTPUT_MODELS:
+        raise typer.BadParameter(
+            f"{oracle_model.value} does not support structured outputs; use one of: {supported}.",
+            param_hint="--oracle-model",
+        )
+    if not strict and survivor_oracle_model not in _STRUCTURED_OUTPUT_MODELS:
+        raise typer.BadParameter(
+            f"{survivor_oracle_model.value} does not support structured outputs; use one of: {supported}.",
+            param_hint="--survivor-oracle-model",
+        )
 
-    typer.secho(f"Using model: {model.value}", fg=typer.colors.GREEN)
-    typer.secho(f"Loaded {len(names)} names.", fg=typer.colors.BLUE)
+    if not no_oracle_cache:
+        _open_oracle_disk_cache()
+    try:
+        asyncio.run(_amain(
+            input_file,
+            model,
+            target_name,
+            max_rounds,
+            experiment_name,
+            oracle_model,
+            oracle_model if strict else survivor_oracle_model,
+            reasoning_effort,
+            context_window,
+            api_key,
+            question_cache,
+        ))
+    except (OracleReplyError, OracleRequestError) as exc:
+        typer.secho(f"Error: oracle failed, stopping the game: {exc}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    finally:
+        _close_oracle_disk_cache()
 
-    # initialize survivor pool, deviation and survivors count tracking
-    survivors = names.copy()
-    deviations = []
-    yes_counts = []
-    no_counts = []
-    survivors_counts = [len(survivors)]
 
-    # select target character
-    target = target_name if target_name else select_target_name(names)
-    typer.secho(f"Target selected: {target}", fg=typer.colors.MAGENTA)
+async def _amain(
+    input_file: Path,
+    model: OpenAIModel,
+    target_name: str | None,
+    max_rounds: int,
+    experiment_name: str,
+    oracle_model: OpenAIModel,
+    survivor_oracle_model: OpenAIModel,
+    reasoning_effort: ReasoningEffort,
+    context_window: int,
+    api_key: str,
+    question_cache: QuestionCache | None,
+) -> None:
+    """
+    Play the game inside a single event loop; shared HTTP clients are closed on the way out.
+    """
+    async_client = _get_async_client(api_key)
+    try:
+        # Read names from file
+        content = input_file.read_text(encoding="utf-8")
+        names = [line.strip() for line in content.splitlines() if line.strip()]
 
-    # start guessing loop
-    messages = [
-        {"role": "system", "content": f"You are playing a guess-the-character game. Possible characters are: {', '.join(names)}. Ask yes/no questions to identify the character. You are in a competition with other players. Try to guess the character in the least number of questions possible."}
-    ]
+        typer.secho(f"Using model: {model.value}", fg=typer.colors.GREEN)
+        typer.secho(f"Loaded {len(names)} names.", fg=typer.colors.BLUE)
 
-    # define async helper for oracle on a single candidate
-    async def oracle_async(question: str, target: str, model: OpenAIModel, client: AsyncOpenAI) -> str:
-        """
-        Async oracle helper: evaluate question against a target character.
-        """
-        system_prompt = (
-            "You are a reasoning oracle. Evaluate whether the target character fits the question. "
-            "If the question is a direct guess of the character and correct, respond with <answer>successful_guess</answer>. "
-            "If incorrect guess, respond with <answer>no</answer>. "
-            "For yes/no questions, think step by step and respond with <answer>yes</answer> or <answer>no</answer>."
-        )
-        user_prompt = (
-            f"Question to evaluate: {question}\n"
-            f"Target character: {target}\n"
-            "After reasoning, output only one of: <answer>yes</answer>, <answer>no</answer>, or <answer>successful_guess</answer>."
-        )
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": user_prompt},
-        ]
-        response = await client.chat.completions.create(
-            model=model.value,
-            messages=messages,
-            max_completion_tokens=20000,
-        )
-        reply = response.choices[0].message.content.strip()
-        match = re.search(r"<answer>(yes|no|successful_guess)</answer>", reply, re.IGNORECASE)
-        if match:
-            return match.group(1).lower()
-        low = reply.lower()
-        if "successful_guess" in low:
-            return "successful_guess"
-        return "yes" if "yes" in low else "no"
-
-    for idx in range(max_rounds):
-        question = ask_model(messages, model, reasoning_effort)
-        typer.secho(f"Model: {question}", fg=typer.colors.YELLOW)
-        # use unified async oracle for ground truth
-        answer = loop.run_until_complete(
-            oracle_async(question, target, oracle_model, async_client)
-        )
-        typer.secho(f"Oracle: {answer}", fg=typer.colors.CYAN)
-        messages.append({"role": "assistant", "content": question})
-        messages.append({"role": "user", "content": answer})
-        if answer == "successful_guess":
-            typer.secho("Model guessed the character!", fg=typer.colors.GREEN)
-            break
-        # evaluate split factor among current survivors asynchronously
-        results_list = loop.run_until_complete(
-            asyncio.gather(*(
-                oracle_async(question, cand, oracle_model, async_client)
-                for cand in survivors
-            ))
-        )
-        yes_count = results_list.count("yes")
-        no_count = results_list.count("no")
-        yes_counts.append(yes_count)
-        no_counts.append(no_count)
-        results = dict(zip(survivors, results_list))
-        survivors = [c for c, res in results.items() if res == answer]
-        survivors_counts.append(len(survivors))
-        # compute deviation from perfect split (0.5)
-        total = yes_count + no_count
-        split = yes_count / total if total else 0
-        deviation = abs(split - 0.5)
-        deviations.append(deviation)
-        typer.secho(
-            f"After Q{idx+1}: yes={yes_count}, no={no_count}, ground_truth={answer}",
-            fg=typer.colors.MAGENTA,
-        )
-    typer.secho("Max questions reached. Game over.", fg=typer.colors.RED)
+        # initialize survivor pool
+        survivors = names.copy()
+
+        # select target character
+        target = target_name if target_name else select_target_name(names)
+        typer.secho(f"Target selected: {target}", fg=typer.colors.MAGENTA)
+
+        # record params up front so a partial run is still identifiable
+        exp_dir = Path("experiments") / experiment_name
+        exp_dir.mkdir(parents=True, exist_ok=True)
+        params = {
+            "input_file": str(input_file),
+            "model": model.value,
+            "oracle_model": oracle_model.value,
+            "survivor_oracle_model": survivor_oracle_model.value,
+            "reasoning_effort": reasoning_effort.value,
+            "context_window": context_window,
+            "max_rounds": max_rounds,
+            "target_name": target_name,
+            "use_cache": question_cache is not None,
+            "oracle_disk_cache": _ORACLE_DISK_CACHE is not None,
+        }
+        (exp_dir / "params.json").write_text(json.dumps(params, indent=2))
+
+        # start guessing loop
+        system_message = {"role": "system", "content": f"You are playing a guess-the-character game. Possible characters are: {', '.join(names)}. Ask yes/no questions to identify the character. You are in a competition with other players. Try to guess the character in the least number of questions possible."}
+        # with a context window only the last K question/answer turns are resent
+        history = deque(maxlen=2 * context_window if context_window else None)
+
+        # stream one JSON line per question (line-buffered) so results survive a crash
+        records_file = exp_dir / "results.jsonl"
+        with records_file.open("w", encoding="utf-8", buffering=1) as f:
+            for idx in range(max_rounds):
+                messages = [system_message, *history]
+                # older turns may have been dropped, so summarize where the game stands; only while
+                # the pool is non-empty and still holds the target, so the note can't mislead
+                if context_window and target in survivors and len(survivors) < len(names):
+                    messages.append({"role": "system", "content": f"Candidates not yet ruled out by the oracle's screening: {', '.join(survivors)}."})
+                question = await ask_model(messages, model, reasoning_effort, async_client, question_cache)
+                typer.secho(f"Model: {question}", fg=typer.colors.YELLOW)
+                target_overrides = 0
+                if survivor_oracle_model == oracle_model:
+                    # score every survivor in one batched request; the target's verdict is the ground
+                    # truth, so it rides along (appended if the oracle already filtered it out) instead
+                    # of being asked twice
+                    pool = survivors if target in survivors else [*survivors, target]
+                    pool_results = await oracle_batch_async(question, pool, oracle_model, api_key)
+                    answer = pool_results[pool.index(target)]
+                    results_list = pool_results[:len(survivors)]
+                else:
+                    # the strong oracle answers for the target while the cheap one scores survivors
+                    answer, results_list = await _gather_or_cancel(
+                        oracle_async(question, target, oracle_model, api_key),
+                        oracle_batch_async(question, survivors, survivor_oracle_model, api_key),
+                    )
+                    # the strong verdict is ground truth for the target: override the cheap one so
+                    # the target can never be filtered out, and keep count of the disagreement
+                    for i, cand in enumerate(survivors):
+                        if cand == target and results_list[i] != answer:
+                            results_list[i] = answer
+                            target_overrides += 1
+                            typer.secho(
+                                f"Survivor oracle disagreed on the target ({survivor_oracle_model.value} vs {oracle_model.value}); using {answer}.",
+                                fg=typer.colors.RED,
+                            )
+                typer.secho(f"Oracle: {answer}", fg=typer.colors.CYAN)
+                history.append({"role": "assistant", "content": question})
+                history.append({"role": "user", "content": answer})
+                if answer == "successful_guess":
+                    typer.secho("Model guessed the character!", fg=typer.colors.GREEN)
+                    break
+                verdict_counts = Counter(results_list)
+                yes_count = verdict_counts["yes"]
+                no_count = verdict_counts["no"]
+                survivors_count = len(survivors)
+                survivors = [c for c, res in zip(survivors, results_list) if res == answer]
+                # compute deviation from perfect split (0.5)
+                total = yes_count + no_count
+                split = yes_count / total if total else 0
+                deviation = abs(split - 0.5)
+                record = {
+                    "question_number": idx + 1,
+                    "yes_count": yes_count,
+                    "no_count": no_count,
+                    "survivors_count": survivors_count,
+                    "deviation": deviation,
+                    "target_verdict_overrides": target_overrides,
+                }
+                f.write(json.dumps(record) + "\n")
+                os.fsync(f.fileno())
+                typer.secho(
+                    f"After Q{idx+1}: yes={yes_count}, no={no_count}, ground_truth={answer}",
+                    fg=typer.colors.MAGENTA,
+                )
+        typer.secho("Max questions reached. Game over.", fg=typer.colors.RED)
+    finally:
+        await _close_http_clients()
 
-    # save results to JSONL
-    exp_dir = Path("experiments") / experiment_name
-    exp_dir.mkdir(parents=True, exist_ok=True)
-    params = {
-        "input_file": str(input_file),
-        "model": model.value,
-        "oracle_model": oracle_model.value,
-        "reasoning_effort": reasoning_effort.value,
-        "max_rounds": max_rounds,
-        "target_name": target_name,
-    }
-    (exp_dir / "params.json").write_text(json.dumps(params, indent=2))
-
-    records_file = exp_dir / "results.jsonl"
-    with records_file.open("w", encoding="utf-8") as f:
-        for i, deviation in enumerate(deviations, start=1):
-            record = {
-                "question_number": i,
-                "yes_count": yes_counts[i-1],
-                "no_count": no_counts[i-1],
-                "survivors_count": survivors_counts[i-1],
-                "deviation": deviation,
-            }
-            f.write(json.dumps(record) + "\n")
 
 def select_target_name(names: list[str]) -> str:
     return random.choice(names)
 
-def ask_model(messages: list[dict], model: OpenAIModel, reasoning_effort: ReasoningEffort) -> str:
-    # Send request with unified parameters
-    response = openai.chat.completions.create(
+async def ask_model(
+    messages: list[dict],
+    model: OpenAIModel,
+    reasoning_effort: ReasoningEffort,
+    client: AsyncOpenAI,
+    cache: QuestionCache | None = None,
+) -> str:
+    if cache is not None:
+        cached = cache.lookup(messages, model.value, reasoning_effort.value)
+        if cached is not None:
+            return cached
+    # Send request with unified parameters over the shared pooled client
+    response = await client.chat.completions.create(
         model=model.value,
         messages=messages,
         max_completion_tokens=30000,
         reasoning_effort=reasoning_effort.value,
     )
-    return response.choices[0].message.content
+    question = response.choices[0].message.content
+    if cache is not None:
+        cache.store(messages, model.value, reasoning_effort.value, question)
+    return question
 
 if __name__ == "__main__":
     app()
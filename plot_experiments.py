@@ -1,12 +1,16 @@
 import json
 from pathlib import Path
 from typing import List
+from concurrent.futures import ThreadPoolExecutor
 
 import typer
+import numpy as np
+import pandas as pd
 import matplotlib.pyplot as plt
 from itertools import cycle
 import seaborn as sns
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 
 app = typer.Typer()
 
@@ -20,6 +24,38 @@ for _style in preferred_styles:
         plt.style.use(_style)
         break
 
+def _load_one_exp(exp: str, experiments_dir: Path) -> tuple[str, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Read one experiment's params.json and results.jsonl.
+    Returns (label, question numbers, deviations, survivor counts).
+    """
+    exp_path = experiments_dir / exp
+    if not exp_path.exists():
+        typer.secho(f"Experiment directory not found: {exp_path}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    # load params for label
+    params_file = exp_path / "params.json"
+    if not params_file.exists():
+        label = exp
+    else:
+        with params_file.open(encoding='utf-8') as f:
+            params = json.load(f)
+        label = f"{exp} ({params.get('model')}, eff={params.get('reasoning_effort')})"
+    # read results
+    results_file = exp_path / "results.jsonl"
+    if not results_file.exists():
+        typer.secho(f"Results file not found: {results_file}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    df = pd.read_json(results_file, lines=True).reindex(
+        columns=["question_number", "deviation", "survivors_count"]
+    )
+    return (
+        label,
+        df["question_number"].to_numpy(),
+        df["deviation"].to_numpy(),
+        df["survivors_count"].to_numpy(),
+    )
+
 @app.command()
 def plot(
     experiments: List[str] = typer.Argument(..., help="Names of experiments to plot"),
@@ -41,50 +77,31 @@ def plot(
     color_cycler = cycle(sns.color_palette("tab10"))
     legend_lines = []
     legend_labels = []
-    # iterate experiments
-    for exp in experiments:
-        exp_path = experiments_dir / exp
-        if not exp_path.exists():
-            typer.secho(f"Experiment directory not found: {exp_path}", fg=typer.colors.RED)
-            raise typer.Exit(1)
-        # load params for label
-        params_file = exp_path / "params.json"
-        if not params_file.exists():
-            label = exp
-        else:
-            params = json.loads(params_file.read_text(encoding='utf-8'))
-            label = f"{exp} ({params.get('model')}, eff={params.get('reasoning_effort')})"
-        # read results
-        results_file = exp_path / "results.jsonl"
-        if not results_file.exists():
-            typer.secho(f"Results file not found: {results_file}", fg=typer.colors.RED)
-            raise typer.Exit(1)
-        q_nums, deviations, survivors = [], [], []
-        for line in results_file.read_text(encoding='utf-8').splitlines():
-            record = json.loads(line)
-            q_nums.append(record.get("question_number"))
-            deviations.append(record.get("deviation"))
-            survivors.append(record.get("survivors_count"))
+    # one polyline per experiment, drawn later as a single collection per axis
+    dev_segments, surv_segments, colors, point_colors = [], [], [], []
+    # read all experiments concurrently (I/O bound); plotting below stays on this thread
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        loaded = list(ex.map(lambda exp: _load_one_exp(exp, experiments_dir), experiments))
+    for label, q_nums, deviations, survivors in loaded:
         color = next(color_cycler)
-        # deviation solid
-        dev_line, = ax1.plot(
-            q_nums,
-            deviations,
-            color=color,
-            marker='o',
-            linewidth=2,
-        )
-        # survivors dashed on twin axis
-        ax2.plot(
-            q_nums,
-            survivors,
-            color=color,
-            linestyle='--',
-            marker='s',
-            linewidth=1.5,
-        )
-        legend_lines.append(dev_line)
+        dev_segments.append(np.column_stack([q_nums, deviations]))
+        surv_segments.append(np.column_stack([q_nums, survivors]))
+        colors.append(color)
+        point_colors.extend([color] * len(q_nums))
+        legend_lines.append(Line2D([0], [0], color=color, marker='o', linewidth=2))
         legend_labels.append(label)
+    # deviation solid
+    ax1.add_collection(LineCollection(dev_segments, colors=colors, linewidths=2))
+    # survivors dashed on twin axis
+    ax2.add_collection(LineCollection(surv_segments, colors=colors, linestyles='--', linewidths=1.5))
+    # markers as one scatter per axis instead of one artist per line
+    if point_colors:
+        dev_xy = np.concatenate(dev_segments)
+        surv_xy = np.concatenate(surv_segments)
+        ax1.scatter(dev_xy[:, 0], dev_xy[:, 1], c=point_colors, marker='o', s=36, zorder=3)
+        ax2.scatter(surv_xy[:, 0], surv_xy[:, 1], c=point_colors, marker='s', s=36, zorder=3)
+    ax1.autoscale_view()
+    ax2.autoscale_view()
     # axis styling
     ax1.axhline(0, color='gray', linestyle='--', linewidth=1)
     ax1.set_xlabel('Question Number', fontsize=12)
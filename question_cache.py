@@ -0,0 +1,113 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+
+
+DEFAULT_CACHE_FILE = Path.home() / ".guess_who_cache" / "questions.jsonl"
+
+
+class QuestionCache:
+    """
+    Two-tier cache for questions generated by ask_model, persisted as JSONL.
+
+    The exact tier keys on (model, reasoning effort, full message thread). The semantic
+    tier only compares threads that share the model, effort, system prompt and the exact
+    sequence of oracle answers, and matches when the embedding of the asked questions has
+    cosine similarity >= threshold. Requires sentence-transformers and faiss-cpu.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_FILE,
+        threshold: float = 0.95,
+        embedding_model: str = "all-MiniLM-L6-v2",
+    ) -> None:
+        try:
+            import faiss
+            import numpy as np
+            from sentence_transformers import SentenceTransformer
+        except ImportError as exc:
+            raise ImportError(
+                "--use-cache requires sentence-transformers and faiss-cpu "
+                "(pip install sentence-transformers faiss-cpu)"
+            ) from exc
+        self._faiss = faiss
+        self._np = np
+        self._encoder = SentenceTransformer(embedding_model)
+        self._dim = self._encoder.get_sentence_embedding_dimension()
+        self.path = path
+        self.threshold = threshold
+        self._exact: dict[str, str] = {}
+        # bucket key -> (inner-product index over normalized embeddings, cached questions)
+        self._buckets: dict[str, tuple[object, list[str]]] = {}
+        self._load()
+
+    @staticmethod
+    def _hash(*parts: object) -> str:
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _split(messages: list[dict]) -> tuple[list[str], list[str], str]:
+        system = [m["content"] for m in messages if m["role"] == "system"]
+        answers = [m["content"] for m in messages if m["role"] == "user"]
+        asked = "\n".join(m["content"] for m in messages if m["role"] == "assistant")
+        return system, answers, asked
+
+    def _keys(self, messages: list[dict], model: str, reasoning_effort: str) -> tuple[str, str, str]:
+        system, answers, asked = self._split(messages)
+        exact_key = self._hash(model, reasoning_effort, messages)
+        bucket_key = self._hash(model, reasoning_effort, system, answers)
+        return exact_key, bucket_key, asked
+
+    def _embed(self, text: str):
+        vec = self._encoder.encode([text], normalize_embeddings=True)
+        return self._np.asarray(vec, dtype="float32")
+
+    def _index(self, bucket_key: str, embedding, question: str) -> None:
+        if bucket_key not in self._buckets:
+            self._buckets[bucket_key] = (self._faiss.IndexFlatIP(self._dim), [])
+        index, questions = self._buckets[bucket_key]
+        index.add(embedding)
+        questions.append(question)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        for line in self.path.read_text(encoding="utf-8").splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # a run interrupted mid-append leaves a truncated last line; skip it
+                continue
+            self._exact[record["key"]] = record["question"]
+            if record.get("embedding") is not None:
+                embedding = self._np.asarray([record["embedding"]], dtype="float32")
+                self._index(record["bucket"], embedding, record["question"])
+
+    def lookup(self, messages: list[dict], model: str, reasoning_effort: str) -> str | None:
+        exact_key, bucket_key, asked = self._keys(messages, model, reasoning_effort)
+        if exact_key in self._exact:
+            return self._exact[exact_key]
+        if not asked or bucket_key not in self._buckets:
+            return None
+        index, questions = self._buckets[bucket_key]
+        scores, ids = index.search(self._embed(asked), 1)
+        if ids[0][0] >= 0 and scores[0][0] >= self.threshold:
+            return questions[ids[0][0]]
+        return None
+
+    def store(self, messages: list[dict], model: str, reasoning_effort: str, question: str) -> None:
+        exact_key, bucket_key, asked = self._keys(messages, model, reasoning_effort)
+        self._exact[exact_key] = question
+        embedding = None
+        if asked:
+            vec = self._embed(asked)
+            self._index(bucket_key, vec, question)
+            embedding = vec[0].tolist()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        record = {"key": exact_key, "bucket": bucket_key, "question": question, "embedding": embedding}
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())